@@ -47,6 +47,13 @@ SERVICE_CONFIGS = {
     },
 }
 
+# Comma-separated default scopes per service, joined once at import
+DEFAULT_SCOPES = {
+    service_name: ','.join(config['default_scopes'])
+    for service_name, config in SERVICE_CONFIGS.items()
+    if 'default_scopes' in config
+}
+
 def get_service_config(service_name: str) -> Dict[str, Any]:
     """
     Get configuration for a specific service.
@@ -1,6 +1,8 @@
 from django.conf import settings
 
 EXTRACTION_SERVICE_BASE_URL = "http://localhost:3005/api/extract"  # Default URL for the extraction service
+EXTRACTION_SERVICE_TIMEOUT = getattr(settings, "EXTRACTION_SERVICE_TIMEOUT", 10)  # Seconds per request
+CONNECTION_VALIDATION_TIMEOUT = getattr(settings, "CONNECTION_VALIDATION_TIMEOUT", 10)  # Seconds per credential check
 
 EXTRACTION_ENDPOINTS = {
     "start": lambda connection_id: f"{EXTRACTION_SERVICE_BASE_URL}/start/{connection_id}",
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organization', '0006_remove_datasourceconfig_data_source_connect_eccafa_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='datasourceconfig',
+            index=models.Index(fields=['organisation', '-created_at'], name='data_source_organis_c413f5_idx'),
+        ),
+    ]
@@ -27,6 +27,7 @@ class DataSourceConfig(models.Model):
         ('completed', 'Completed'),
         ('failed', 'Failed'),
     ]
+    EXTRACTION_STATUSES = frozenset(key for key, _ in EXTRACTION_STATUS_CHOICES)
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     service_name = models.CharField(max_length=100, choices=SERVICE_CHOICES)
@@ -66,6 +67,7 @@ class DataSourceConfig(models.Model):
         indexes = [
             models.Index(fields=['service_name']),
             models.Index(fields=['status']),
+            models.Index(fields=['organisation', '-created_at']),
         ]
         ordering = ['-created_at']
 
@@ -102,12 +104,14 @@ class DataSourceConfig(models.Model):
                 raise ValidationError({'api_key': f'API key is required for {self.get_service_name_display()}.'})
 
     def save(self, *args, **kwargs):
-        self.full_clean()  # Enforce validation before saving
+        # The primary key (the only unique field) and the organisation foreign key
+        # are enforced by the database, so skip the SELECTs full_clean would run
+        # to re-check them on every save.
+        self.full_clean(exclude=['organisation'], validate_unique=False)  # Enforce validation before saving
         super().save(*args, **kwargs)
 
     def update_extraction_status(self, status: str):
-        if status not in dict(self.EXTRACTION_STATUS_CHOICES):
+        if status not in self.EXTRACTION_STATUSES:
             raise ValueError(f"Invalid extraction status: {status}")
         self.extraction_status = status
-        self.updated_at = timezone.now()
         self.save(update_fields=['extraction_status', 'updated_at'])
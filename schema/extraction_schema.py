@@ -17,6 +17,7 @@ def extract_start_schema():
             400: ExtractErrorSerializer,
             404: "Not Found",
             500: ExtractErrorSerializer,
+            504: ExtractErrorSerializer,
         }
     )
 
@@ -27,6 +28,7 @@ def extract_status_schema():
             200: ExtractStatusResponseSerializer,
             404: "Not Found",
             500: ExtractErrorSerializer,
+            504: ExtractErrorSerializer,
         }
     )
 
@@ -38,5 +40,6 @@ def extract_result_schema():
             202: openapi.Response(description="Result not ready."),
             404: "Not Found",
             500: ExtractErrorSerializer,
+            504: ExtractErrorSerializer,
         }
     )
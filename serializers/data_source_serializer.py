@@ -1,7 +1,9 @@
 import uuid
 from rest_framework import serializers
 from organization.models.data_source_model import DataSourceConfig
-from organization.config.service_config import get_service_config, get_api_endpoint, validate_service_config
+from organization.config.service_config import (
+    DEFAULT_SCOPES, get_service_config, get_api_endpoint, validate_service_config
+)
 
 class DataSourceConfigSerializer(serializers.ModelSerializer):
     service_name = serializers.CharField(source='get_service_name_display')
@@ -59,7 +61,7 @@ class CreateDataSourceConfigSerializer(serializers.ModelSerializer):
 
         # Set default scopes if not provided
         if 'scopes' in service_config.get('optional_fields', []) and not data.get('scopes'):
-            data['scopes'] = ','.join(service_config.get('default_scopes', []))
+            data['scopes'] = DEFAULT_SCOPES.get(service_name, '')
 
         return data
     
@@ -74,38 +76,3 @@ class UpdateDataSourceConfigSerializer(serializers.ModelSerializer):
     class Meta:
         model = DataSourceConfig
         fields = ["description", "client_id", "client_secret", "api_key", "scopes", "status"]
-
-
-class DataSourceConfigInputSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = DataSourceConfig
-        fields = [
-            'service_name',
-            'tenant_id',
-            'client_id',
-            'client_secret',
-            'api_key',
-            'description',
-            'auth_type',
-            'scopes'
-        ]
-        extra_kwargs = {
-            'service_name': {'required': True},
-            'tenant_id': {'required': False},
-            'client_id': {'required': False},
-            'client_secret': {'required': False},
-            'api_key': {'required': False},
-            'description': {'required': False},
-            'auth_type': {'required': False},
-            'scopes': {'required': False}
-        }
-
-class DataSourceConfigOutputSerializer(serializers.ModelSerializer):
-    service_name = serializers.CharField(source='get_service_name_display')
-    
-    class Meta:
-        model = DataSourceConfig
-        fields = [
-            'connection_id',
-            'status'
-        ] 
\ No newline at end of file
@@ -2,8 +2,18 @@ from rest_framework import status
 import requests
 from typing import Dict, Tuple
 from organization.config.service_config import SERVICE_CONFIGS, SERVICE_API_ENDPOINTS
-from organization.serializers.connection_serializer import ConnectionValidationResponseSerializer
+from organization.config.service_endpoints import CONNECTION_VALIDATION_TIMEOUT
 from organization.models.data_source_model import DataSourceConfig
+from organization.services.http_session import create_session
+
+# Shared across requests so credential checks reuse pooled keep-alive connections.
+connection_session = create_session()
+
+CONNECTION_ERROR_MESSAGES = {
+    "invalid_credentials": "Invalid credentials provided",
+    "insufficient_permissions": "Insufficient permissions for the provided credentials",
+    "connection_error": "Unable to reach the service",
+}
 
 class ConnectionValidationError(Exception):
     def __init__(self, message: str, status: str):
@@ -25,7 +35,7 @@ class ConnectionService:
                 'grant_type': 'client_credentials'
             }
             
-            response = requests.post(token_url, data=token_data)
+            response = connection_session.post(token_url, data=token_data, timeout=CONNECTION_VALIDATION_TIMEOUT)
             
             if response.status_code == 200:
                 return True, "connected"
@@ -44,9 +54,10 @@ class ConnectionService:
         """Validate Dropbox connection credentials."""
         try:
             headers = {'Authorization': f'Bearer {api_key}'}
-            response = requests.post(
+            response = connection_session.post(
                 'https://api.dropboxapi.com/2/users/get_current_account',
-                headers=headers
+                headers=headers,
+                timeout=CONNECTION_VALIDATION_TIMEOUT
             )
             
             if response.status_code == 200:
@@ -82,6 +93,11 @@ class ConnectionService:
                 "unsupported_service"
             ) 
         
+    @staticmethod
+    def get_error_message(connection_status: str) -> str:
+        """Return a human-readable message for a failed connection status."""
+        return CONNECTION_ERROR_MESSAGES.get(connection_status, "Connection validation failed")
+
     @staticmethod
     def check_connection_and_prepare_response(data_source : DataSourceConfig):
         try:
@@ -92,30 +108,25 @@ class ConnectionService:
                 "client_secret": data_source.client_secret,
                 "api_key": data_source.api_key
             })
-
-            # Update status in DB
-            data_source.status = connection_status
-            data_source.save()
-
-            response_data = {
-                "status": "success" if is_valid else "error",
-                "message": "Connection validated successfully" if is_valid else ConnectionService.get_error_message(connection_status),
-                "connection_id": data_source.connection_id,
-            }
-            if not is_valid:
-                response_data["error_code"] = connection_status
-
-            serializer = ConnectionValidationResponseSerializer(data=response_data)
-            serializer.is_valid(raise_exception=True)
-            return serializer.data, status.HTTP_200_OK if is_valid else status.HTTP_400_BAD_REQUEST
-
-        except Exception as e:
+        except ConnectionValidationError as e:
             response_data = {
                 "status": "error",
-                "message": str(e) or "An unexpected error occurred",
+                "message": e.message,
                 "error_code": "internal_error",
-                "connection_id": data_source.connection_id
+                "connection_id": str(data_source.id)
             }
-            serializer = ConnectionValidationResponseSerializer(data=response_data)
-            serializer.is_valid(raise_exception=True)
-            return serializer.data, status.HTTP_500_INTERNAL_SERVER_ERROR
\ No newline at end of file
+            return response_data, status.HTTP_500_INTERNAL_SERVER_ERROR
+
+        # Update status in DB
+        data_source.status = connection_status
+        data_source.save(update_fields=['status', 'updated_at'])
+
+        response_data = {
+            "status": "success" if is_valid else "error",
+            "message": "Connection validated successfully" if is_valid else ConnectionService.get_error_message(connection_status),
+            "connection_id": str(data_source.id),
+        }
+        if not is_valid:
+            response_data["error_code"] = connection_status
+
+        return response_data, status.HTTP_200_OK if is_valid else status.HTTP_400_BAD_REQUEST
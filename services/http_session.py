@@ -0,0 +1,15 @@
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+
+
+def create_session() -> requests.Session:
+    """
+    Create a pooled HTTP session for calls to external services.
+
+    The session keeps connections alive across requests but refuses cookies,
+    so no state carries over between calls made for different tenants.
+    """
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
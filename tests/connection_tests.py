@@ -1,4 +1,5 @@
 import json
+import uuid
 from unittest.mock import patch, MagicMock
 from django.urls import reverse
 from rest_framework import status
@@ -30,7 +31,6 @@ class ConnectionTests(APITestCase):
         # Create test Microsoft 365 data source
         self.ms365_source = DataSourceConfig.objects.create(
             service_name='microsoft_365',
-            connection_id='ms365-test-1',
             tenant_id='test-tenant',
             description='Test Microsoft 365 connection',
             api_endpoint=SERVICE_API_ENDPOINTS['microsoft_365'],
@@ -45,7 +45,6 @@ class ConnectionTests(APITestCase):
         # Create test Dropbox data source
         self.dropbox_source = DataSourceConfig.objects.create(
             service_name='dropbox',
-            connection_id='dropbox-test-1',
             description='Test Dropbox connection',
             api_endpoint=SERVICE_API_ENDPOINTS['dropbox'],
             auth_type=SERVICE_CONFIGS['dropbox']['auth_type'],
@@ -54,7 +53,7 @@ class ConnectionTests(APITestCase):
             organisation=self.organization
         )
 
-    @patch('organization.services.connection_service.requests.post')
+    @patch('organization.services.connection_service.connection_session.post')
     def test_connect_microsoft365_valid_credentials(self, mock_post):
         """Test connecting with valid Microsoft 365 credentials."""
         # Mock successful response
@@ -66,13 +65,13 @@ class ConnectionTests(APITestCase):
         response = self.client.post(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['status'], 'success')
-        self.assertEqual(response.data['connection_id'], 'ms365-test-1')
+        self.assertEqual(response.data['connection_id'], str(self.ms365_source.id))
         
         # Verify status was updated in database
         self.ms365_source.refresh_from_db()
         self.assertEqual(self.ms365_source.status, 'connected')
 
-    @patch('organization.services.connection_service.requests.post')
+    @patch('organization.services.connection_service.connection_session.post')
     def test_connect_microsoft365_invalid_credentials(self, mock_post):
         """Test connecting with invalid Microsoft 365 credentials."""
         # Mock unauthorized response
@@ -90,7 +89,7 @@ class ConnectionTests(APITestCase):
         self.ms365_source.refresh_from_db()
         self.assertEqual(self.ms365_source.status, 'invalid_credentials')
 
-    @patch('organization.services.connection_service.requests.post')
+    @patch('organization.services.connection_service.connection_session.post')
     def test_connect_dropbox_valid_credentials(self, mock_post):
         """Test connecting with valid Dropbox credentials."""
         # Mock successful response
@@ -102,13 +101,13 @@ class ConnectionTests(APITestCase):
         response = self.client.post(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['status'], 'success')
-        self.assertEqual(response.data['connection_id'], 'dropbox-test-1')
+        self.assertEqual(response.data['connection_id'], str(self.dropbox_source.id))
         
         # Verify status was updated in database
         self.dropbox_source.refresh_from_db()
         self.assertEqual(self.dropbox_source.status, 'connected')
 
-    @patch('organization.services.connection_service.requests.post')
+    @patch('organization.services.connection_service.connection_session.post')
     def test_connect_dropbox_invalid_credentials(self, mock_post):
         """Test connecting with invalid Dropbox credentials."""
         # Mock unauthorized response
@@ -128,13 +127,33 @@ class ConnectionTests(APITestCase):
 
     def test_connect_nonexistent_source(self):
         """Test connecting to a non-existent data source."""
-        url = reverse('datasource-connect', kwargs={'pk': 99999})
+        url = reverse('datasource-connect', kwargs={'pk': uuid.uuid4()})
         response = self.client.post(url)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertIn('detail', response.data)
+
+    def test_connect_unsupported_service(self):
+        """Test connecting a service without a connection validator."""
+        slack_source = DataSourceConfig.objects.create(
+            service_name='slack',
+            api_endpoint=SERVICE_API_ENDPOINTS['slack'],
+            auth_type=SERVICE_CONFIGS['slack']['auth_type'],
+            api_key='test-slack-token',
+            organisation=self.organization
+        )
+
+        url = reverse('datasource-connect', kwargs={'pk': slack_source.id})
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
         self.assertEqual(response.data['status'], 'error')
-        self.assertEqual(response.data['message'], 'Data source configuration not found')
+        self.assertEqual(response.data['error_code'], 'internal_error')
+        self.assertEqual(response.data['connection_id'], str(slack_source.id))
+
+        # Status is left untouched when validation cannot run
+        slack_source.refresh_from_db()
+        self.assertEqual(slack_source.status, 'not_connected')
 
-    @patch('organization.services.connection_service.requests.post')
+    @patch('organization.services.connection_service.connection_session.post')
     def test_connect_insufficient_permissions(self, mock_post):
         """Test connecting with insufficient permissions."""
         # Mock forbidden response
@@ -152,7 +171,7 @@ class ConnectionTests(APITestCase):
         self.ms365_source.refresh_from_db()
         self.assertEqual(self.ms365_source.status, 'insufficient_permissions')
 
-    @patch('organization.services.connection_service.requests.post')
+    @patch('organization.services.connection_service.connection_session.post')
     def test_connect_connection_error(self, mock_post):
         """Test connecting when there's a connection error."""
         # Mock connection error
@@ -166,4 +185,15 @@ class ConnectionTests(APITestCase):
         
         # Verify status was updated in database
         self.ms365_source.refresh_from_db()
-        self.assertEqual(self.ms365_source.status, 'connection_error') 
\ No newline at end of file
+        self.assertEqual(self.ms365_source.status, 'connection_error')
+
+    @patch('organization.services.connection_service.connection_session.post')
+    def test_connect_timeout(self, mock_post):
+        """Test that a provider timeout is reported as a connection error."""
+        mock_post.side_effect = requests.exceptions.Timeout()
+
+        url = reverse('datasource-connect', kwargs={'pk': self.dropbox_source.id})
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error_code'], 'connection_error')
+        self.assertIsNotNone(mock_post.call_args.kwargs.get('timeout'))
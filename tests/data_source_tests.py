@@ -56,7 +56,6 @@ class DataSourceConfigTests(APITestCase):
         # Create test data source config
         self.data_source = DataSourceConfig.objects.create(
             service_name='microsoft_365',
-            connection_id='ms365-test-1',
             tenant_id='test-tenant',
             description='Test Microsoft 365 connection',
             api_endpoint=SERVICE_API_ENDPOINTS['microsoft_365'],
@@ -117,6 +116,21 @@ class DataSourceConfigTests(APITestCase):
         self.assertEqual(response.data['service_name'], 'Microsoft 365')
         self.assertEqual(response.data['connection_id'], 'ms365-test-1')
 
+    def test_retrieve_data_source_not_modified(self):
+        """Test that a matching If-None-Match returns 304 without a body."""
+        url = reverse('datasource-retrieve', kwargs={'pk': self.data_source.id})
+        response = self.client.get(url)
+        self.assertIn('ETag', response)
+        etag = response['ETag']
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+        # Any update changes the ETag
+        self.data_source.update_extraction_status('in_progress')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
     def test_list_data_sources(self):
         """Test listing all data source configurations."""
         url = reverse('datasource-list')
@@ -0,0 +1,80 @@
+from unittest.mock import patch, MagicMock
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from organization.models.data_source_model import DataSourceConfig
+from organization.models.organization_model import Organization
+from organization.config.service_config import SERVICE_CONFIGS, SERVICE_API_ENDPOINTS
+import requests
+
+class ExtractionTests(APITestCase):
+    def setUp(self):
+        self.organization = Organization.objects.create(
+            name="Test Org",
+            email="test@org.com",
+            phone="+123456789",
+            address="123 Test St",
+            website="http://test.org",
+            industry="Testing",
+            size=50
+        )
+        self.data_source = DataSourceConfig.objects.create(
+            service_name='dropbox',
+            description='Test Dropbox connection',
+            api_endpoint=SERVICE_API_ENDPOINTS['dropbox'],
+            auth_type=SERVICE_CONFIGS['dropbox']['auth_type'],
+            api_key='test-api-key',
+            organisation=self.organization
+        )
+        self.start_url = reverse('extract-start', kwargs={'pk': self.data_source.id})
+
+    @patch('organization.views.extraction_views.extraction_session.post')
+    def test_start_extraction(self, mock_post):
+        """Test that an accepted start marks the extraction as in progress."""
+        mock_response = MagicMock()
+        mock_response.status_code = 202
+        mock_post.return_value = mock_response
+
+        response = self.client.post(self.start_url)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.data_source.refresh_from_db()
+        self.assertEqual(self.data_source.extraction_status, 'in_progress')
+
+    @patch('organization.views.extraction_views.extraction_session.post')
+    def test_start_extraction_timeout(self, mock_post):
+        """Test that a timeout returns 504 without recording a failure."""
+        mock_post.side_effect = requests.exceptions.ReadTimeout()
+
+        response = self.client.post(self.start_url)
+        self.assertEqual(response.status_code, status.HTTP_504_GATEWAY_TIMEOUT)
+        self.data_source.refresh_from_db()
+        self.assertEqual(self.data_source.extraction_status, 'not_started')
+
+    @patch('organization.views.extraction_views.extraction_session.post')
+    def test_start_extraction_connect_timeout(self, mock_post):
+        """Test that a connect timeout records a failure."""
+        mock_post.side_effect = requests.exceptions.ConnectTimeout()
+
+        response = self.client.post(self.start_url)
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.data_source.refresh_from_db()
+        self.assertEqual(self.data_source.extraction_status, 'failed')
+
+    @patch('organization.views.extraction_views.extraction_session.post')
+    def test_start_extraction_connection_error(self, mock_post):
+        """Test that an unreachable extraction service records a failure."""
+        mock_post.side_effect = requests.exceptions.ConnectionError()
+
+        response = self.client.post(self.start_url)
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.data_source.refresh_from_db()
+        self.assertEqual(self.data_source.extraction_status, 'failed')
+
+    @patch('organization.views.extraction_views.extraction_session.get')
+    def test_extraction_status_timeout(self, mock_get):
+        """Test that a status timeout returns 504."""
+        mock_get.side_effect = requests.exceptions.ReadTimeout()
+
+        url = reverse('extract-status', kwargs={'pk': self.data_source.id})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_504_GATEWAY_TIMEOUT)
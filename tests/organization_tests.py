@@ -55,6 +55,25 @@ class OrganizationTests(APITestCase):
         write_log_block("Retrieve Organization", url, "GET", None, status.HTTP_200_OK, response)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_retrieve_organization_not_modified(self):
+        url = f"/api/organization/{self.organization.id}/"
+        response = self.client.get(url)
+        self.assertIn("ETag", response)
+        etag = response["ETag"]
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_retrieve_organization_modified_after_update(self):
+        url = f"/api/organization/{self.organization.id}/"
+        etag = self.client.get(url)["ETag"]
+        payload = {"name": "Renamed Org"}
+        self.client.put(f"/api/organization/{self.organization.id}/update/", data=payload, format='json')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        write_log_block("Retrieve Organization After Update", url, "GET", None, status.HTTP_200_OK, response)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["name"], "Renamed Org")
+
     def test_list_organization(self):
         url = "/api/organization/list/"
         response = self.client.get(url)
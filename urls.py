@@ -1,4 +1,4 @@
-from django.urls import path
+from django.urls import include, path
 from .views.organization_views import (
     OrganizationCreateAPIView, OrganizationDeleteAPIView, OrganizationListAPIView,
     OrganizationRetrieveAPIView, OrganizationUpdateAPIView,
@@ -31,36 +31,49 @@ from .views.email_extraction_views import (
     CancelBatchEmailExtractionView,
 )
 
-urlpatterns = [
-    path("organization/", OrganizationCreateAPIView.as_view(), name="create-organization"),
-    path("organization/<uuid:pk>/", OrganizationRetrieveAPIView.as_view(), name="retrieve-organization"),
-    path("organization/list/", OrganizationListAPIView.as_view(), name="list-organization"),
-    path("organization/<uuid:pk>/update/", OrganizationUpdateAPIView.as_view(), name="update-organization"),
-    path("organization/<uuid:pk>/delete/", OrganizationDeleteAPIView.as_view(), name="delete-organization"),
-    
-    # Data Source Configuration URLs
-    path('datasource/', DataSourceConfigCreateAPIView.as_view(), name='datasource-create'),
-    path('datasource/<int:pk>/', DataSourceConfigRetrieveAPIView.as_view(), name='datasource-retrieve'),
-    path('datasource/list/', DataSourceConfigListAPIView.as_view(), name='datasource-list'),
-    path('datasource/<int:pk>/update/', DataSourceConfigUpdateAPIView.as_view(), name='datasource-update'),
-    path('datasource/<int:pk>/delete/', DataSourceConfigDeleteAPIView.as_view(), name='datasource-delete'),
-    path('datasource/<int:pk>/connect/', DataSourceConnectAPIView.as_view(), name='datasource-connect'),
+organization_patterns = [
+    path("", OrganizationCreateAPIView.as_view(), name="create-organization"),
+    path("<uuid:pk>/", OrganizationRetrieveAPIView.as_view(), name="retrieve-organization"),
+    path("list/", OrganizationListAPIView.as_view(), name="list-organization"),
+    path("<uuid:pk>/update/", OrganizationUpdateAPIView.as_view(), name="update-organization"),
+    path("<uuid:pk>/delete/", OrganizationDeleteAPIView.as_view(), name="delete-organization"),
+]
+
+# Data Source Configuration URLs
+datasource_patterns = [
+    path('', DataSourceConfigCreateAPIView.as_view(), name='datasource-create'),
+    path('<uuid:pk>/', DataSourceConfigRetrieveAPIView.as_view(), name='datasource-retrieve'),
+    path('list/', DataSourceConfigListAPIView.as_view(), name='datasource-list'),
+    path('<uuid:pk>/update/', DataSourceConfigUpdateAPIView.as_view(), name='datasource-update'),
+    path('<uuid:pk>/delete/', DataSourceConfigDeleteAPIView.as_view(), name='datasource-delete'),
+    path('<uuid:pk>/connect/', DataSourceConnectAPIView.as_view(), name='datasource-connect'),
+]
 
-    path("extract/<uuid:pk>/start/", ExtractStartAPIView.as_view(), name="extract-start"),
-    path("extract/<uuid:pk>/status/", ExtractStatusAPIView.as_view(), name="extract-status"),
-    path("extract/<uuid:pk>/result/", ExtractResultAPIView.as_view(), name="extract-result"),
+extract_patterns = [
+    path("<uuid:pk>/start/", ExtractStartAPIView.as_view(), name="extract-start"),
+    path("<uuid:pk>/status/", ExtractStatusAPIView.as_view(), name="extract-status"),
+    path("<uuid:pk>/result/", ExtractResultAPIView.as_view(), name="extract-result"),
+]
+
+# Email Extraction URLs
+email_extract_patterns = [
+    path('start/<str:connection_id>/', StartEmailExtractionView.as_view(), name='email_extract_start'),
+    path('status/<str:connection_id>/', EmailExtractionStatusView.as_view(), name='email_extract_status'),
+    path('result/<str:connection_id>/', EmailExtractionResultView.as_view(), name='email_extract_result'),
+    path('batch/start/', StartBatchEmailExtractionView.as_view(), name='email_extract_batch_start'),
+    path('batch/status/<str:batch_id>/', BatchEmailExtractionStatusView.as_view(), name='email_extract_batch_status'),
+    path('batch/result/<str:batch_id>/', BatchEmailExtractionResultView.as_view(), name='email_extract_batch_result'),
+    path('pause/<str:connection_id>/', PauseEmailExtractionView.as_view(), name='email_extract_pause'),
+    path('continue/<str:connection_id>/', ContinueEmailExtractionView.as_view(), name='email_extract_continue'),
+    path('cancel/<str:connection_id>/', CancelEmailExtractionView.as_view(), name='email_extract_cancel'),
+    path('batch/pause/<str:batch_id>/', PauseBatchEmailExtractionView.as_view(), name='email_extract_batch_pause'),
+    path('batch/continue/<str:batch_id>/', ContinueBatchEmailExtractionView.as_view(), name='email_extract_batch_continue'),
+    path('batch/cancel/<str:batch_id>/', CancelBatchEmailExtractionView.as_view(), name='email_extract_batch_cancel'),
+]
 
-    # Email Extraction URLs
-    path('email-extract/start/<str:connection_id>/', StartEmailExtractionView.as_view(), name='email_extract_start'),
-    path('email-extract/status/<str:connection_id>/', EmailExtractionStatusView.as_view(), name='email_extract_status'),
-    path('email-extract/result/<str:connection_id>/', EmailExtractionResultView.as_view(), name='email_extract_result'),
-    path('email-extract/batch/start/', StartBatchEmailExtractionView.as_view(), name='email_extract_batch_start'),
-    path('email-extract/batch/status/<str:batch_id>/', BatchEmailExtractionStatusView.as_view(), name='email_extract_batch_status'),
-    path('email-extract/batch/result/<str:batch_id>/', BatchEmailExtractionResultView.as_view(), name='email_extract_batch_result'),
-    path('email-extract/pause/<str:connection_id>/', PauseEmailExtractionView.as_view(), name='email_extract_pause'),
-    path('email-extract/continue/<str:connection_id>/', ContinueEmailExtractionView.as_view(), name='email_extract_continue'),
-    path('email-extract/cancel/<str:connection_id>/', CancelEmailExtractionView.as_view(), name='email_extract_cancel'),
-    path('email-extract/batch/pause/<str:batch_id>/', PauseBatchEmailExtractionView.as_view(), name='email_extract_batch_pause'),
-    path('email-extract/batch/continue/<str:batch_id>/', ContinueBatchEmailExtractionView.as_view(), name='email_extract_batch_continue'),
-    path('email-extract/batch/cancel/<str:batch_id>/', CancelBatchEmailExtractionView.as_view(), name='email_extract_batch_cancel'),
+urlpatterns = [
+    path("organization/", include(organization_patterns)),
+    path('datasource/', include(datasource_patterns)),
+    path("extract/", include(extract_patterns)),
+    path('email-extract/', include(email_extract_patterns)),
 ]
@@ -4,6 +4,8 @@ from rest_framework.response import Response
 from rest_framework import status
 from drf_yasg.utils import swagger_auto_schema
 from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 
 from organization.models.data_source_model import DataSourceConfig
 from organization.serializers.data_source_serializer import (
@@ -32,11 +34,19 @@ class DataSourceConfigCreateAPIView(APIView):
 class DataSourceConfigRetrieveAPIView(APIView):
     """Retrieve a data source configuration by ID."""
 
-    @swagger_auto_schema(responses={200: DataSourceConfigSerializer, 404: "Not Found"})
+    @swagger_auto_schema(responses={200: DataSourceConfigSerializer, 304: "Not Modified", 404: "Not Found"})
     def get(self, request, pk, *args, **kwargs):
         data_source = get_object_or_404(DataSourceConfig, pk=pk)
+        # Answer If-None-Match with a 304 so unchanged configurations skip serialization.
+        etag = quote_etag(f"{data_source.id}-{data_source.updated_at.timestamp()}")
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            not_modified["ETag"] = etag
+            return not_modified
         serializer = DataSourceConfigSerializer(data_source)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        response = Response(serializer.data, status=status.HTTP_200_OK)
+        response["ETag"] = etag
+        return response
 
 class DataSourceConfigListAPIView(APIView):
     """List all data source configurations."""
@@ -72,7 +82,7 @@ class DataSourceConfigDeleteAPIView(APIView):
 
     @swagger_auto_schema(responses={204: "No Content", 404: "Not Found"})
     def delete(self, request, pk, *args, **kwargs):
-        data_source = get_object_or_404(DataSourceConfig, pk=pk)
+        data_source = get_object_or_404(DataSourceConfig.objects.only("id"), pk=pk)
         data_source.delete()
         return Response(
             {"message": "Data source configuration deleted successfully"},
@@ -6,13 +6,18 @@ from django.shortcuts import get_object_or_404
 import requests
 
 from organization.models.data_source_model import DataSourceConfig
-from organization.config.service_endpoints import EXTRACTION_ENDPOINTS
+from organization.config.service_endpoints import EXTRACTION_ENDPOINTS, EXTRACTION_SERVICE_TIMEOUT
+from organization.services.http_session import create_session
 from organization.schema.extraction_schema import (
     extract_start_schema,
     extract_status_schema,
     extract_result_schema,
 )
 
+# Shared across requests so calls to the extraction service reuse pooled
+# keep-alive connections instead of opening a new one each time.
+extraction_session = create_session()
+
 
 class ExtractStartAPIView(APIView):
     """Starts the data extraction process for a data source."""
@@ -24,7 +29,7 @@ class ExtractStartAPIView(APIView):
 
         try:
             payload = data_source.to_dict()
-            response = requests.post(url, json=payload)
+            response = extraction_session.post(url, json=payload, timeout=EXTRACTION_SERVICE_TIMEOUT)
 
             if response.status_code == 202:
                 data_source.update_extraction_status("in_progress")
@@ -41,6 +46,14 @@ class ExtractStartAPIView(APIView):
             data_source.update_extraction_status("failed")
             return Response({"error": "Failed to start extraction."}, status=response.status_code)
 
+        except requests.exceptions.ReadTimeout:
+            # The request reached the service, which may still have accepted the
+            # job, so leave the status as is. Connect timeouts fall through below.
+            return Response(
+                {"error": "Extraction service timed out."},
+                status=status.HTTP_504_GATEWAY_TIMEOUT,
+            )
+
         except requests.exceptions.RequestException as e:
             data_source.update_extraction_status("failed")
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -51,11 +64,12 @@ class ExtractStatusAPIView(APIView):
 
     @extract_status_schema()
     def get(self, request, pk):
-        data_source = get_object_or_404(DataSourceConfig, pk=pk)
+        # Only the id is forwarded to the extraction service.
+        data_source = get_object_or_404(DataSourceConfig.objects.only("id"), pk=pk)
         url = EXTRACTION_ENDPOINTS["status"](data_source.id)
 
         try:
-            response = requests.get(url)
+            response = extraction_session.get(url, timeout=EXTRACTION_SERVICE_TIMEOUT)
             if response.status_code == 200:
                 return Response(response.json(), status=status.HTTP_200_OK)
 
@@ -64,6 +78,12 @@ class ExtractStatusAPIView(APIView):
                 status=response.status_code,
             )
 
+        except requests.exceptions.Timeout:
+            return Response(
+                {"error": "Extraction service timed out."},
+                status=status.HTTP_504_GATEWAY_TIMEOUT,
+            )
+
         except requests.exceptions.RequestException as e:
             return Response(
                 {"error": str(e)},
@@ -76,11 +96,12 @@ class ExtractResultAPIView(APIView):
 
     @extract_result_schema()
     def get(self, request, pk):
-        data_source = get_object_or_404(DataSourceConfig, pk=pk)
+        # Only the id is forwarded to the extraction service.
+        data_source = get_object_or_404(DataSourceConfig.objects.only("id"), pk=pk)
         url = EXTRACTION_ENDPOINTS["result"](data_source.id)
 
         try:
-            response = requests.get(url)
+            response = extraction_session.get(url, timeout=EXTRACTION_SERVICE_TIMEOUT)
 
             if response.status_code == 200:
                 return Response(response.json(), status=status.HTTP_200_OK)
@@ -96,6 +117,12 @@ class ExtractResultAPIView(APIView):
                 status=response.status_code,
             )
 
+        except requests.exceptions.Timeout:
+            return Response(
+                {"error": "Extraction service timed out."},
+                status=status.HTTP_504_GATEWAY_TIMEOUT,
+            )
+
         except requests.exceptions.RequestException as e:
             return Response(
                 {"error": str(e)},
@@ -1,5 +1,7 @@
 from django.contrib.auth import logout
 from django.shortcuts import get_object_or_404, redirect
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 from django.views import View
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status
@@ -44,11 +46,19 @@ class OrganizationCreateAPIView(APIView):
 class OrganizationRetrieveAPIView(APIView):
     """Retrieve an organization by ID."""
 
-    @swagger_auto_schema(responses={200: OrganizationSerializer, 404: "Not Found"})
+    @swagger_auto_schema(responses={200: OrganizationSerializer, 304: "Not Modified", 404: "Not Found"})
     def get(self, request, pk, *args, **kwargs):
         organization = get_object_or_404(Organization, pk=pk)
+        # Answer If-None-Match with a 304 so unchanged organizations skip serialization.
+        etag = quote_etag(f"{organization.id}-{organization.updated_at.timestamp()}")
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            not_modified["ETag"] = etag
+            return not_modified
         serializer = OrganizationSerializer(organization)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        response = Response(serializer.data, status=status.HTTP_200_OK)
+        response["ETag"] = etag
+        return response
 
 
 class OrganizationListAPIView(APIView):
@@ -86,7 +96,7 @@ class OrganizationDeleteAPIView(APIView):
 
     @swagger_auto_schema(responses={204: "No Content", 404: "Not Found"})
     def delete(self, request, pk, *args, **kwargs):
-        organization = get_object_or_404(Organization, pk=pk)
+        organization = get_object_or_404(Organization.objects.only("id"), pk=pk)
         organization.delete()
         return Response(
             {"message": "Organization deleted successfully"},